@@ -0,0 +1,28 @@
+"""Optional ahead-of-time build for the lexer and parser.
+
+The interpreter runs fine as plain Python; this only exists to compile
+the two hottest modules to C extensions when Cython is available:
+
+    pip install cython setuptools && python setup.py build_ext --inplace
+
+The modules are compiled as-is (pure-Python mode, no .pyx sources), so
+the build is a drop-in speedup and the .py files stay the single source
+of truth. Without Cython installed this script is a no-op.
+"""
+try:
+    from Cython.Build import cythonize
+    from setuptools import setup
+except ImportError:
+    cythonize = None
+
+if __name__ == '__main__':
+    if cythonize is None:
+        print('Cython not installed, nothing to build; the interpreter runs as plain Python.')
+    else:
+        setup(
+            name='vih',
+            ext_modules=cythonize(
+                ['src/lexer.py', 'src/parser.py'],
+                language_level=3,
+            ),
+        )
@@ -0,0 +1,29 @@
+"""Lazy re-exports for the interpreter stages (PEP 562).
+
+Importing `src` stays cheap: the lexer, parser and evaluator modules are
+only loaded when one of their names is first touched, so tools that need
+just one stage do not pay for initializing the others.
+"""
+from importlib import import_module
+
+_SUBMODULES = {
+    'Lexer': '.lexer',
+    'Token': '.lexer',
+    'TokenType': '.lexer',
+    'Parser': '.parser',
+    'PARSER_VERSION': '.parser',
+    'eval': '.evaluator',
+    'Environment': '.evaluator',
+    'ObjectType': '.evaluator',
+}
+
+__all__ = list(_SUBMODULES)
+
+
+def __getattr__(name):
+    module_name = _SUBMODULES.get(name, None)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,7 +1,14 @@
+import ast as python_ast
+import builtins
+import sys
+from array import array
+from collections import ChainMap
+from itertools import islice
 from typing import Optional
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 
 from .parser import (
+    fold,
     Program,
     ExpressionStatement,
     BlockStatement,
@@ -23,24 +30,21 @@ from .parser import (
 
 
 class Environment:
+    __slots__ = ('store', 'outer', 'lookup', 'trace_eval')
+
+    # The builtin table is identical for every frame; it is shared as a
+    # class attribute, assigned at the bottom of this module once the
+    # builtin functions exist.
+    builtin: dict
+
     def __init__(self, trace_eval=False):
         self.store = {}
-        self.builtin = {
-            "len": BuiltinObject(builtin_len),
-            "first": BuiltinObject(builtin_first),
-            "last": BuiltinObject(builtin_last),
-            "rest": BuiltinObject(builtin_rest),
-            "push": BuiltinObject(builtin_push),
-            "puts": BuiltinObject(builtin_puts),
-        }
         self.outer: Optional[Environment] = None
+        self.lookup = ChainMap(self.store)
         self.trace_eval = trace_eval
 
     def get(self, identifier):
-        value = self.store.get(identifier, None)
-        if value is None and self.outer is not None:
-            return self.outer.get(identifier)
-        return value
+        return self.lookup.get(identifier, None)
 
     def set(self, identifier, value):
         self.store[identifier] = value
@@ -49,6 +53,16 @@ class Environment:
         if identifier in self.store:
             del self.store[identifier]
 
+    def reset(self):
+        """Return the environment to its freshly-constructed state.
+
+        Clears bindings in place so a caller running many programs can
+        reuse one environment instead of allocating a new one each time.
+        """
+        self.store.clear()
+        self.outer = None
+        self.lookup = ChainMap(self.store)
+
     def __str__(self):
         items = []
         for k, v in self.store.items():
@@ -65,7 +79,11 @@ class Environment:
         return f"{{{', '.join(items)}}}"
 
 
-class ObjectType(Enum):
+class ObjectType(IntEnum):
+    # IntEnum formats as a bare int on 3.11+; keep the qualified name in
+    # case a member ever ends up in user-facing text.
+    __str__ = Enum.__str__
+
     INTEGER = auto()
     BOOLEAN = auto()
     RETURN_VALUE = auto()
@@ -125,14 +143,13 @@ class FunctionObject(Object):
         self.parameters = parameters
         self.body = body
         self.env = env
+        self._compiled = None
 
     def __str__(self) -> str:
-        params = ', '.join([str(p) for p in self.parameters])
-        return f"func({params}) {{\n{self.body}\n}}"
-    
+        return f"func({', '.join(map(str, self.parameters))}) {{\n{self.body}\n}}"
+
     def compact_str(self):
-        params = ', '.join([str(p) for p in self.parameters])
-        return f"func({params})"
+        return f"func({', '.join(map(str, self.parameters))})"
 
 
 class BuiltinObject(Object):
@@ -145,18 +162,22 @@ class BuiltinObject(Object):
 
 
 class ListObject(Object):
-    def __init__(self, elements):
+    def __init__(self, elements, start=0, end=None):
         super().__init__(ObjectType.LIST)
         self.elements = elements
+        self.start = start
+        self.end = len(elements) if end is None else end
+
+    def __len__(self):
+        return self.end - self.start
 
     def get_index(self, idx):
-        if idx.value < 0 or idx.value >= len(self.elements):
-            return new_error("Index %d out of bounds for collection of len %d", idx.value, len(self.elements))
-        return self.elements[idx.value]
+        if idx.value < 0 or idx.value >= len(self):
+            return new_error("Index %d out of bounds for collection of len %d", idx.value, len(self))
+        return self.elements[self.start + idx.value]
 
     def __str__(self) -> str:
-        elements = ', '.join([str(e) for e in self.elements])
-        return f"[{elements}]"
+        return f"[{', '.join(map(str, islice(self.elements, self.start, self.end)))}]"
 
 
 class ErrorObject(Object):
@@ -180,86 +201,278 @@ NULL = NullObject()
 TRUE = BooleanObject(True)
 FALSE = BooleanObject(False)
 
+_TYPE_NAMES = {otype: otype.name for otype in ObjectType}
+
 
 def eval(node, env: Environment):
     if env.trace_eval:
         print("evaluating:", type(node), node.token, "env:", env)
-    if isinstance(node, Program):
-        return eval_program(node, env)
-    if isinstance(node, ExpressionStatement):
-        return eval(node.expression, env)
-    if isinstance(node, BlockStatement):
-        return eval_block_statement(node, env)
-    if isinstance(node, ReturnStatement):
-        value = eval(node.return_value, env)
-        if is_error(value):
-            return value
-        return ReturnObject(value)
-    if isinstance(node, ForStatement):
-        return eval_for_statement(node, env)
-    if isinstance(node, LetStatement):
-        value = eval(node.value, env)
-        if is_error(value):
-            return value
-        env.set(node.name.value, value)
+    handler = _EVAL_DISPATCH.get(type(node), None)
+    if handler is None:
+        return None
+    return handler(node, env)
+
+
+def eval_expression_statement(node, env):
+    return eval(node.expression, env)
+
+
+def eval_return_statement(node, env):
+    value = eval(node.return_value, env)
+    if is_error(value):
+        return value
+    return ReturnObject(value)
+
+
+def eval_let_statement(node, env):
+    value = eval(node.value, env)
+    if is_error(value):
+        return value
+    env.set(node.name.value, value)
+    return None
+
+
+def eval_prefix(node, env):
+    right = eval(node.right, env)
+    if is_error(right):
+        return right
+    return eval_prefix_expression(node.operator, right)
+
+
+def eval_infix(node, env):
+    left = eval(node.left, env)
+    if is_error(left):
+        return left
+    right = eval(node.right, env)
+    if is_error(right):
+        return right
+    return eval_infix_expression(node.operator, left, right)
+
+
+def eval_integer_literal(node, env):
+    return IntegerObject(node.value)
+
+
+def eval_string_literal(node, env):
+    return StringObject(node.value)
+
+
+def eval_boolean(node, env):
+    return native_bool_to_boolean_object(node.value)
+
+
+def eval_identifier(node, env):
+    value = env.get(node.value)
+    if value is not None:
+        return value
+    value = env.builtin.get(node.value, None)
+    if value is not None:
+        return value
+    return ErrorObject(_ERR_IDENTIFIER_NOT_FOUND(node.value))
+
+
+def eval_function_literal(node, env):
+    return FunctionObject(node.parameters, node.body, env)
+
+
+def eval_list_literal(node, env):
+    elements = eval_expressions(node.elements, env)
+    if len(elements) == 1 and isinstance(elements[0], ErrorObject):
+        return elements[0]
+    return ListObject(elements)
+
+
+def eval_call_expression(node, env):
+    function = eval(node.function, env)
+    if is_error(function):
+        return function
+    args = eval_expressions(node.arguments, env)
+    if is_error(args):
+        return args
+    return apply_function(function, args)
+
+
+def eval_index(node, env):
+    collection = eval(node.collection, env)
+    if is_error(collection):
+        return collection
+    idx = eval(node.idx, env)
+    if is_error(idx):
+        return idx
+    return eval_index_expression(collection, idx)
+
+
+_PY_BIN_OPS = {
+    '+': python_ast.Add,
+    '-': python_ast.Sub,
+    '*': python_ast.Mult,
+}
+
+_PY_CMP_OPS = {
+    '<': python_ast.Lt,
+    '>': python_ast.Gt,
+    '<=': python_ast.LtE,
+    '>=': python_ast.GtE,
+    '==': python_ast.Eq,
+    '!=': python_ast.NotEq,
+}
+
+
+def compile_to_python(program):
+    """Translate a pure constant-expression program to a Python code object.
+
+    Supported nodes are integer/boolean literals and the prefix and infix
+    operators over them; evaluation then runs in CPython's bytecode
+    interpreter instead of the tree walker. Returns None when the program
+    contains anything else, and callers fall back to eval().
+    """
+    if not isinstance(program, Program) or len(program.statements) != 1:
+        return None
+    stmt = program.statements[0]
+    if not isinstance(stmt, ExpressionStatement):
+        return None
+    expr = _to_python_expr(stmt.expression)
+    if expr is None:
+        return None
+    tree = python_ast.Expression(body=expr)
+    python_ast.fix_missing_locations(tree)
+    return compile(tree, '<vih>', 'eval')
+
+
+def _to_python_expr(node):
+    if isinstance(node, (IntegerLiteral, Boolean)):
+        return python_ast.Constant(node.value)
     if isinstance(node, PrefixExpression):
-        right = eval(node.right, env)
-        if is_error(right):
-            return right
-        return eval_prefix_expression(node.operator, right)
+        right = _to_python_expr(node.right)
+        if right is None:
+            return None
+        if node.operator == '-':
+            return python_ast.UnaryOp(op=python_ast.USub(), operand=right)
+        if node.operator == '!':
+            return python_ast.UnaryOp(op=python_ast.Not(), operand=right)
+        return None
     if isinstance(node, InfixExpression):
-        left = eval(node.left, env)
-        if is_error(left):
-            return left
-        right = eval(node.right, env)
-        if is_error(right):
-            return right
-        return eval_infix_expression(node.operator, left, right)
-    if isinstance(node, IfExpression):
-        return eval_if_expression(node, env)
-    if isinstance(node, IntegerLiteral):
-        return IntegerObject(node.value)
-    if isinstance(node, StringLiteral):
-        return StringObject(node.value)
-    if isinstance(node, Boolean):
-        return native_bool_to_boolean_object(node.value)
-    if isinstance(node, Identifier):
-        value = env.get(node.value)
-        if value is not None:
-            return value
-        value = env.builtin.get(node.value, None)
-        if value is not None:
-            return value
-        return new_error("identifier not found: %s", node.value)
-    if isinstance(node, FunctionLiteral):
-        params = node.parameters
-        body = node.body
-        return FunctionObject(params, body, env)
-    if isinstance(node, ListLiteral):
-        elements = eval_expressions(node.elements, env)
-        if len(elements) == 1 and isinstance(elements[0], ErrorObject):
-            return elements[0]
-        return ListObject(elements)
-    if isinstance(node, CallExpression):
-        function = eval(node.function, env)
-        if is_error(function):
-            return function
-        args = eval_expressions(node.arguments, env)
-        if is_error(args):
-            return args
-        return apply_function(function, args)
-    if isinstance(node, IndexExpression):
-        collection = eval(node.collection, env)
-        if is_error(collection):
-            return collection
-        idx = eval(node.idx, env)
-        if is_error(idx):
-            return idx
-        return eval_index_expression(collection, idx)
+        left = _to_python_expr(node.left)
+        right = _to_python_expr(node.right)
+        if left is None or right is None:
+            return None
+        bin_op = _PY_BIN_OPS.get(node.operator, None)
+        if bin_op is not None:
+            return python_ast.BinOp(left=left, op=bin_op(), right=right)
+        cmp_op = _PY_CMP_OPS.get(node.operator, None)
+        if cmp_op is not None:
+            return python_ast.Compare(left=left, ops=[cmp_op()], comparators=[right])
+        if node.operator == '/':
+            # vih division truncates towards zero: int(a / b).
+            division = python_ast.BinOp(left=left, op=python_ast.Div(), right=right)
+            return python_ast.Call(func=python_ast.Name('int', ctx=python_ast.Load()),
+                                   args=[division], keywords=[])
+        return None
     return None
 
 
+def run_compiled(code):
+    value = builtins.eval(code, {'int': int, '__builtins__': {}})
+    if isinstance(value, bool):
+        return native_bool_to_boolean_object(value)
+    return IntegerObject(value)
+
+
+# Opcodes for the postfix (RPN) fast path over integer arithmetic.
+_RPN_PUSH = 0
+_RPN_ADD = 1
+_RPN_SUB = 2
+_RPN_MUL = 3
+_RPN_DIV = 4
+_RPN_NEG = 5
+
+_RPN_INFIX_OPS = {
+    '+': _RPN_ADD,
+    '-': _RPN_SUB,
+    '*': _RPN_MUL,
+    '/': _RPN_DIV,
+}
+
+
+def flatten_to_rpn(program):
+    """Flatten a pure integer-arithmetic program into postfix buffers.
+
+    Returns parallel (opcodes, operands) typed arrays - one byte per
+    opcode, one signed 64-bit slot per operand - so the whole flattened
+    program sits in two contiguous buffers instead of a pointer-chased
+    node tree. run_rpn evaluates them with a small stack, replacing the
+    per-node dispatch of the tree walker. Returns None for programs using
+    anything beyond integer literals, unary minus and integer arithmetic;
+    callers fall back to eval().
+    """
+    if not isinstance(program, Program) or len(program.statements) != 1:
+        return None
+    stmt = program.statements[0]
+    if not isinstance(stmt, ExpressionStatement):
+        return None
+    opcodes = array('b')
+    operands = array('q')
+    if not _flatten_expr(stmt.expression, opcodes, operands):
+        return None
+    return opcodes, operands
+
+
+def _flatten_expr(node, opcodes, operands):
+    if isinstance(node, IntegerLiteral):
+        if not -2**63 <= node.value < 2**63:
+            # Literal does not fit the 64-bit operand slots.
+            return False
+        opcodes.append(_RPN_PUSH)
+        operands.append(node.value)
+        return True
+    if isinstance(node, PrefixExpression) and node.operator == '-':
+        if not _flatten_expr(node.right, opcodes, operands):
+            return False
+        opcodes.append(_RPN_NEG)
+        operands.append(0)
+        return True
+    if isinstance(node, InfixExpression):
+        opcode = _RPN_INFIX_OPS.get(node.operator, None)
+        if opcode is None:
+            return False
+        if not _flatten_expr(node.left, opcodes, operands):
+            return False
+        if not _flatten_expr(node.right, opcodes, operands):
+            return False
+        opcodes.append(opcode)
+        operands.append(0)
+        return True
+    return False
+
+
+def run_rpn(opcodes, operands):
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    for opcode, operand in zip(opcodes, operands):
+        if opcode == _RPN_PUSH:
+            push(operand)
+        elif opcode == _RPN_ADD:
+            right = pop()
+            stack[-1] = stack[-1] + right
+        elif opcode == _RPN_SUB:
+            right = pop()
+            stack[-1] = stack[-1] - right
+        elif opcode == _RPN_MUL:
+            right = pop()
+            stack[-1] = stack[-1] * right
+        elif opcode == _RPN_DIV:
+            right = pop()
+            stack[-1] = int(stack[-1] / right)
+        else:
+            stack[-1] = -stack[-1]
+    return IntegerObject(stack[-1])
+
+
 def eval_program(program, env):
+    # Collapse statically known subtrees once before walking; constant
+    # expressions then evaluate as a single literal-node lookup.
+    fold(program)
     result = None
     for stmt in program.statements:
         result = eval(stmt, env)
@@ -311,10 +524,19 @@ def apply_function(function, args):
     if isinstance(function, FunctionObject):
         if len(args) != len(function.parameters):
             return new_error("function requires %d parameters, got %d", len(function.parameters), len(args))
+        if function._compiled is None:
+            function._compiled = compile_body(function.body)
         extended_env = extend_function_env(function, args)
-        evaluated = eval(function.body, extended_env)
+        evaluated = eval(function._compiled, extended_env)
         return unwrap_return_value(evaluated)
-    return new_error("not a function: %s", get_type_name(function))
+    return ErrorObject(_ERR_NOT_A_FUNCTION(get_type_name(function)))
+
+
+def compile_body(body):
+    # Lowers a function body once, on the first call; recursive functions
+    # then reuse the prepared form on every subsequent call. Closures in
+    # vih are purely lexical, so the compiled body never needs invalidation.
+    return fold(body)
 
 
 def extend_function_env(function, args):
@@ -333,6 +555,7 @@ def unwrap_return_value(obj):
 def new_enclosed_environment(outer: Environment):
     env = Environment(outer.trace_eval)
     env.outer = outer
+    env.lookup = ChainMap(env.store, *outer.lookup.maps)
     return env
 
 
@@ -343,22 +566,43 @@ def eval_index_expression(collection, idx):
 
 
 def eval_prefix_expression(operator, right):
-    match operator:
-        case '!':
-            return eval_not_operator_expression(right)
-        case '-':
-            return eval_minus_prefix_operator_expression(right)
-        case _:
-            return new_error('unknown operator: %s%s', operator, get_type_name(right))
+    if operator == '!':
+        return eval_not_operator_expression(right)
+    if operator == '-':
+        return eval_minus_prefix_operator_expression(right)
+    return ErrorObject(_ERR_UNKNOWN_PREFIX_OP(operator, get_type_name(right)))
+
+
+# Handlers for well-typed infix operations, keyed on the operand types
+# and the operator: one dict probe replaces the branch chain the old
+# isinstance/match cascade walked for every arithmetic op.
+_INFIX_HANDLERS = {}
+for _op, _handler in (
+    ('+', lambda l, r: IntegerObject(l.value + r.value)),
+    ('-', lambda l, r: IntegerObject(l.value - r.value)),
+    ('*', lambda l, r: IntegerObject(l.value * r.value)),
+    ('/', lambda l, r: IntegerObject(int(l.value / r.value))),
+    ('<', lambda l, r: native_bool_to_boolean_object(l.value < r.value)),
+    ('>', lambda l, r: native_bool_to_boolean_object(l.value > r.value)),
+    ('<=', lambda l, r: native_bool_to_boolean_object(l.value <= r.value)),
+    ('>=', lambda l, r: native_bool_to_boolean_object(int(l.value >= r.value))),
+    ('==', lambda l, r: native_bool_to_boolean_object(l.value == r.value)),
+    ('!=', lambda l, r: native_bool_to_boolean_object(int(l.value != r.value))),
+):
+    _INFIX_HANDLERS[ObjectType.INTEGER, ObjectType.INTEGER, _op] = _handler
+_INFIX_HANDLERS[ObjectType.STRING, ObjectType.STRING, '+'] = lambda l, r: StringObject(l.value + r.value)
 
 
 def eval_infix_expression(operator, left, right):
-    if isinstance(left, IntegerObject) and isinstance(right, IntegerObject):
-        return eval_integer_infix_expression(operator, left, right)
-    if isinstance(left, StringObject) and isinstance(right, StringObject):
-        if operator != '+':
-            return new_error('unknown operator: STRING %s STRING', operator)
-        return StringObject(left.value + right.value)
+    # An operand is None when the expression came out of a parse error but
+    # is evaluated anyway (the REPL does this); skip the typed fast path
+    # so such programs degrade to an ErrorObject as they always have.
+    if left is not None and right is not None:
+        handler = _INFIX_HANDLERS.get((left.otype, right.otype, operator), None)
+        if handler is not None:
+            return handler(left, right)
+        if left.otype == ObjectType.STRING and right.otype == ObjectType.STRING:
+            return ErrorObject(_ERR_UNKNOWN_STRING_OP(operator))
     match operator:
         case '<':
             return native_bool_to_boolean_object(left.value < right.value)
@@ -373,33 +617,8 @@ def eval_infix_expression(operator, left, right):
         case '!=':
             return native_bool_to_boolean_object(int(left.value != right.value))
     if type(left) != type(right):
-        return new_error('type mismatch: %s %s %s', get_type_name(left), operator, get_type_name(right))
-    return new_error('unknown operator: %s %s %s', get_type_name(left), operator, get_type_name(right))
-
-
-def eval_integer_infix_expression(operator, left, right):
-    match operator:
-        case '+':
-            return IntegerObject(left.value + right.value)
-        case '-':
-            return IntegerObject(left.value - right.value)
-        case '*':
-            return IntegerObject(left.value * right.value)
-        case '/':
-            return IntegerObject(int(left.value / right.value))
-        case '<':
-            return native_bool_to_boolean_object(left.value < right.value)
-        case '>':
-            return native_bool_to_boolean_object(left.value > right.value)
-        case '<=':
-            return native_bool_to_boolean_object(left.value <= right.value)
-        case '>=':
-            return native_bool_to_boolean_object(int(left.value >= right.value))
-        case '==':
-            return native_bool_to_boolean_object(left.value == right.value)
-        case '!=':
-            return native_bool_to_boolean_object(int(left.value != right.value))
-    return new_error('unknown operator: %s %s %s', get_type_name(left), operator, get_type_name(right))
+        return ErrorObject(_ERR_TYPE_MISMATCH(get_type_name(left), operator, get_type_name(right)))
+    return ErrorObject(_ERR_UNKNOWN_INFIX_OP(get_type_name(left), operator, get_type_name(right)))
 
 
 def native_bool_to_boolean_object(value):
@@ -409,11 +628,11 @@ def native_bool_to_boolean_object(value):
 
 
 def eval_not_operator_expression(right):
-    if right == TRUE:
+    if right is TRUE:
         return FALSE
-    elif right == FALSE:
+    elif right is FALSE:
         return TRUE
-    elif right == NULL:
+    elif right is NULL:
         return TRUE
     else:
         return FALSE
@@ -440,15 +659,25 @@ def eval_if_expression(node, env):
 
 
 def is_truthy(node):
-    if node == NULL:
+    if node is NULL:
         return False
-    if node == TRUE:
+    if node is TRUE:
         return True
-    if node == FALSE:
+    if node is FALSE:
         return False
     return True
 
 
+# Bound .format methods for the error shapes produced on hot eval paths:
+# the format string is parsed once at import instead of on every error.
+_ERR_TYPE_MISMATCH = 'type mismatch: {} {} {}'.format
+_ERR_UNKNOWN_INFIX_OP = 'unknown operator: {} {} {}'.format
+_ERR_UNKNOWN_PREFIX_OP = 'unknown operator: {}{}'.format
+_ERR_UNKNOWN_STRING_OP = 'unknown operator: STRING {} STRING'.format
+_ERR_IDENTIFIER_NOT_FOUND = 'identifier not found: {}'.format
+_ERR_NOT_A_FUNCTION = 'not a function: {}'.format
+
+
 def new_error(format_string, *params):
     return ErrorObject(format_string % params)
 
@@ -460,10 +689,10 @@ def is_error(obj):
 
 
 def get_type_name(expr):
-    try:
-        return expr.otype.name
-    except AttributeError:
+    otype = getattr(expr, 'otype', None)
+    if otype is None:
         return None
+    return _TYPE_NAMES[otype]
 
 
 def builtin_len(*args):
@@ -472,7 +701,7 @@ def builtin_len(*args):
     if isinstance(args[0], StringObject):
         return IntegerObject(len(args[0].value))
     if isinstance(args[0], ListObject):
-        return IntegerObject(len(args[0].elements))
+        return IntegerObject(len(args[0]))
     return ErrorObject('Builtin function len expected type String or List')
 
 
@@ -480,9 +709,9 @@ def builtin_first(*args):
     if len(args) != 1:
         return ErrorObject('Builtin function first expected one argument')
     if isinstance(args[0], ListObject):
-        if len(args[0].elements) < 1:
+        if len(args[0]) < 1:
             return ErrorObject('List is empty')
-        return args[0].elements[0]
+        return args[0].elements[args[0].start]
     return ErrorObject('Builtin function first expected type List')
 
 
@@ -490,9 +719,9 @@ def builtin_last(*args):
     if len(args) != 1:
         return ErrorObject('Builtin function last expected one argument')
     if isinstance(args[0], ListObject):
-        if len(args[0].elements) < 1:
+        if len(args[0]) < 1:
             return ErrorObject('List is empty')
-        return args[0].elements[-1]
+        return args[0].elements[args[0].end - 1]
     return ErrorObject('Builtin function last expected type List')
 
 
@@ -500,9 +729,9 @@ def builtin_rest(*args):
     if len(args) != 1:
         return ErrorObject('Builtin function rest expected one argument')
     if isinstance(args[0], ListObject):
-        if len(args[0].elements) <= 1:
+        if len(args[0]) <= 1:
             return ListObject([])
-        return ListObject(args[0].elements[1:])
+        return ListObject(args[0].elements, args[0].start + 1, args[0].end)
     return ErrorObject('Builtin function rest expected type List')
 
 
@@ -511,12 +740,50 @@ def builtin_push(*args):
         return ErrorObject('Builtin function push expected two arguments')
     value, lst = args
     if isinstance(lst, ListObject):
+        if lst.start != 0 or lst.end != len(lst.elements):
+            # Views share their backing list, so materialize before mutating.
+            lst.elements = lst.elements[lst.start:lst.end]
+            lst.start = 0
         lst.elements.append(value)
+        lst.end = len(lst.elements)
         return lst
     return ErrorObject('Builtin function push expected first argument of type List')
 
 
 def builtin_puts(*args):
-    for arg in args:
-        print(str(arg))
+    if args:
+        sys.stdout.write('\n'.join(map(str, args)) + '\n')
+
+
+Environment.builtin = {
+    "len": BuiltinObject(builtin_len),
+    "first": BuiltinObject(builtin_first),
+    "last": BuiltinObject(builtin_last),
+    "rest": BuiltinObject(builtin_rest),
+    "push": BuiltinObject(builtin_push),
+    "puts": BuiltinObject(builtin_puts),
+}
+
+
+# One dict probe on the node's concrete class replaces the isinstance
+# chain that eval used to walk for every node.
+_EVAL_DISPATCH = {
+    Program: eval_program,
+    ExpressionStatement: eval_expression_statement,
+    BlockStatement: eval_block_statement,
+    ReturnStatement: eval_return_statement,
+    ForStatement: eval_for_statement,
+    LetStatement: eval_let_statement,
+    PrefixExpression: eval_prefix,
+    InfixExpression: eval_infix,
+    IfExpression: eval_if_expression,
+    IntegerLiteral: eval_integer_literal,
+    StringLiteral: eval_string_literal,
+    Boolean: eval_boolean,
+    Identifier: eval_identifier,
+    FunctionLiteral: eval_function_literal,
+    ListLiteral: eval_list_literal,
+    CallExpression: eval_call_expression,
+    IndexExpression: eval_index,
+}
 
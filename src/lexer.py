@@ -1,3 +1,6 @@
+import re
+import sys
+from array import array
 from enum import Enum, auto
 
 
@@ -60,6 +63,8 @@ KEYWORDS = {
 
 
 class Token:
+    __slots__ = ('token_type', 'literal')
+
     def __init__(self, token_type: TokenType, literal: str):
         self.token_type = token_type
         self.literal = literal
@@ -68,85 +73,105 @@ class Token:
         return f"{{{self.token_type.name}:'{self.literal}'}}"
 
 
+# Tokens carry no position and are never mutated, so the ones with a fixed
+# literal are shared singletons instead of per-call allocations.
+_SYMBOL_TOKENS = {
+    '[': Token(TokenType.LBRACKET, '['),
+    ']': Token(TokenType.RBRACKET, ']'),
+    '(': Token(TokenType.LPAR, '('),
+    ')': Token(TokenType.RPAR, ')'),
+    '{': Token(TokenType.LCURLY, '{'),
+    '}': Token(TokenType.RCURLY, '}'),
+    ';': Token(TokenType.SEMICOLON, ';'),
+    ',': Token(TokenType.COMMA, ','),
+    '-': Token(TokenType.MINUS, '-'),
+    '+': Token(TokenType.PLUS, '+'),
+    '*': Token(TokenType.ASTERISK, '*'),
+}
+
+_KEYWORD_TOKENS = {literal: Token(token_type, literal) for literal, token_type in KEYWORDS.items()}
+
+_TOK_EOF = Token(TokenType.EOF, '')
+_TOK_DIV = Token(TokenType.DIV, '/')
+_TOK_EQUALS = Token(TokenType.EQUALS, '=')
+_TOK_NOT = Token(TokenType.NOT, '!')
+_TOK_LT = Token(TokenType.LT, '<')
+_TOK_GT = Token(TokenType.GT, '>')
+_TOK_EQ = Token(TokenType.EQ, '==')
+_TOK_NEQ = Token(TokenType.NEQ, '!=')
+_TOK_LEQ = Token(TokenType.LEQ, '<=')
+_TOK_GEQ = Token(TokenType.GEQ, '>=')
+
+# Precompiled scanners for the multi-character runs. One C-level match
+# replaces the per-character Python loop for identifiers, numbers and
+# whitespace.
+_ID_RE = re.compile(r'\w+')
+_NUM_RE = re.compile(r'\d+')
+_WS_RE = re.compile(r'\s+')
+
+
 class Lexer:
     def __init__(self, input_string: str):
         self.input_string = input_string
+        self.length = len(input_string)
         self.position = 0
         self.ch = ''
 
     def next_token(self) -> Token:
-        if self.position >= len(self.input_string):
-            return Token(TokenType.EOF, '')
+        if self.position >= self.length:
+            return _TOK_EOF
         self.ch = self.input_string[self.position]
         self._skip_whitespace()
+        token = _SYMBOL_TOKENS.get(self.ch, None)
+        if token is not None:
+            self.position += 1
+            return token
         match self.ch:
-            case '[':
-                token = Token(TokenType.LBRACKET, self.ch)
-            case ']':
-                token = Token(TokenType.RBRACKET, self.ch)
-            case '(':
-                token = Token(TokenType.LPAR, self.ch)
-            case ')':
-                token = Token(TokenType.RPAR, self.ch)
-            case '{':
-                token = Token(TokenType.LCURLY, self.ch)
-            case '}':
-                token = Token(TokenType.RCURLY, self.ch)
-            case ';':
-                token = Token(TokenType.SEMICOLON, self.ch)
-            case ',':
-                token = Token(TokenType.COMMA, self.ch)
-            case '-':
-                token = Token(TokenType.MINUS, self.ch)
-            case '+':
-                token = Token(TokenType.PLUS, self.ch)
-            case '*':
-                token = Token(TokenType.ASTERISK, self.ch)
             case '/':
                 if self._peek() == '/':
-                    comment = []
-                    while self.ch != '\n' and self.position < len(self.input_string):
-                        comment.append(self.ch)
-                        self._advance()
-                    token = Token(TokenType.COMMENT, ''.join(comment))
+                    end = self.input_string.find('\n', self.position)
+                    if end == -1:
+                        end = self.length
+                    token = Token(TokenType.COMMENT, self.input_string[self.position:end])
+                    self.position = end
                 else:
-                    token = Token(TokenType.DIV, self.ch)
+                    token = _TOK_DIV
             case '"':
-                string_literal = []
-                self._advance()
-                while self.ch != '"' and self.position < len(self.input_string):
-                    string_literal.append(self.ch)
-                    self._advance()
-                token = Token(TokenType.STRING, ''.join(string_literal))
+                start = self.position + 1
+                end = self.input_string.find('"', start)
+                if end == -1:
+                    end = self.length
+                token = Token(TokenType.STRING, self.input_string[start:end])
+                self.position = end
             case '=':
                 if self._peek() == '=':
-                    token = Token(TokenType.EQ, self.ch + '=')
+                    token = _TOK_EQ
                     self.position += 1
                 else:
-                    token = Token(TokenType.EQUALS, self.ch)
+                    token = _TOK_EQUALS
             case '!':
                 if self._peek() == '=':
-                    token = Token(TokenType.NEQ, self.ch + '=')
+                    token = _TOK_NEQ
                     self.position += 1
                 else:
-                    token = Token(TokenType.NOT, self.ch)
+                    token = _TOK_NOT
             case '<':
                 if self._peek() == '=':
-                    token = Token(TokenType.LEQ, self.ch + '=')
+                    token = _TOK_LEQ
                     self.position += 1
                 else:
-                    token = Token(TokenType.LT, self.ch)
+                    token = _TOK_LT
             case '>':
                 if self._peek() == '=':
-                    token = Token(TokenType.GEQ, self.ch + '=')
+                    token = _TOK_GEQ
                     self.position += 1
                 else:
-                    token = Token(TokenType.GT, self.ch)
+                    token = _TOK_GT
             case '\n':
                 self._advance()
                 return self.next_token()
             case ' ':
-                return Token(TokenType.EOF, '')
+                return _TOK_EOF
             case ch:
                 if ch.isdigit():
                     token = Token(TokenType.DIGIT, self._get_digit())
@@ -157,39 +182,83 @@ class Lexer:
         self.position += 1
         return token
 
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Token:
+        token = self.next_token()
+        if token.token_type == TokenType.EOF:
+            raise StopIteration
+        return token
+
+    def tokenize(self) -> list:
+        """Lex the whole input in one call.
+
+        Returns every token in order, with the trailing EOF token included
+        as a sentinel.
+        """
+        tokens = []
+        next_token = self.next_token
+        token = next_token()
+        while token.token_type != TokenType.EOF:
+            tokens.append(token)
+            token = next_token()
+        tokens.append(token)
+        return tokens
+
+    def tokenize_soa(self) -> tuple:
+        """Lex the whole input into struct-of-arrays form.
+
+        Returns a compact array of TokenType values and a parallel list of
+        literals, for consumers that only need those two fields and not
+        Token objects. The EOF sentinel is included.
+        """
+        token_types = array('i')
+        literals = []
+        next_token = self.next_token
+        token = next_token()
+        while token.token_type != TokenType.EOF:
+            token_types.append(token.token_type.value)
+            literals.append(token.literal)
+            token = next_token()
+        token_types.append(token.token_type.value)
+        literals.append(token.literal)
+        return token_types, literals
+
     def _peek(self) -> str:
-        if self.position < len(self.input_string) - 1:
+        if self.position < self.length - 1:
             return self.input_string[self.position + 1]
         return ''
 
     def _advance(self):
         self.position += 1
-        if self.position < len(self.input_string):
+        if self.position < self.length:
             self.ch = self.input_string[self.position]
         else:
             self.ch = ' '
 
     def _skip_whitespace(self) -> None:
-        while self.ch.isspace() and self.position < len(self.input_string):
-            self._advance()
+        matched = _WS_RE.match(self.input_string, self.position)
+        if matched is not None:
+            self.position = matched.end()
+            if self.position < self.length:
+                self.ch = self.input_string[self.position]
+            else:
+                self.ch = ' '
 
     def _get_digit(self) -> str:
-        digit = []
-        while self.ch.isdigit() and self.position < len(self.input_string):
-            digit.append(self.ch)
-            self._advance()
-        self.position -= 1
-        return ''.join(digit)
+        matched = _NUM_RE.match(self.input_string, self.position)
+        self.position = matched.end() - 1
+        return matched.group()
 
     def _get_identifier(self) -> Token:
-        identifier = []
-        char_suitable = lambda ch: ch.isalnum() or ch == '_'
-        while char_suitable(self.ch) and self.position < len(self.input_string):
-            identifier.append(self.ch) 
-            self._advance()
-        self.position -= 1
-        identifier = ''.join(identifier)
-        if identifier in KEYWORDS:
-            return Token(KEYWORDS[identifier], identifier)
+        matched = _ID_RE.match(self.input_string, self.position)
+        self.position = matched.end() - 1
+        # Interning makes the keyword lookup and every later dict operation
+        # on this name a pointer compare instead of a character compare.
+        identifier = sys.intern(matched.group())
+        token = _KEYWORD_TOKENS.get(identifier, None)
+        if token is not None:
+            return token
         return Token(TokenType.ID, identifier)
 
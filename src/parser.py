@@ -1,9 +1,15 @@
+import sys
 from enum import Enum, auto
 from abc import ABC, abstractmethod
+from io import StringIO
 from typing import Optional, List
 
 from .lexer import Lexer, Token, TokenType
 
+# Bump when the AST shape or parsing behaviour changes: the version is
+# part of the key for on-disk AST caches, so stale pickles are ignored.
+PARSER_VERSION = 1
+
 
 class Precedence(Enum):
     LOWEST = auto()
@@ -19,79 +25,133 @@ class Precedence(Enum):
         return self.value < other.value
 
 
-PRECEDENCES = {
-    TokenType.PLUS: Precedence.SUM,
-    TokenType.MINUS: Precedence.SUM,
-    TokenType.ASTERISK: Precedence.PRODUCT,
-    TokenType.DIV: Precedence.PRODUCT,
-    TokenType.EQ: Precedence.EQUALS,
-    TokenType.NEQ: Precedence.EQUALS,
-    TokenType.LT: Precedence.LESSGREATER,
-    TokenType.GT: Precedence.LESSGREATER,
-    TokenType.LEQ: Precedence.LESSGREATER,
-    TokenType.GEQ: Precedence.LESSGREATER,
-    TokenType.LPAR: Precedence.CALL,
-    TokenType.LBRACKET: Precedence.INDEX,
-}
+_NUM_TOKEN_TYPES = max(tt.value for tt in TokenType) + 1
+
+# Canonical interned operator strings. CPython does not auto-intern the
+# multi-character ones, so routing every parsed operator through this
+# table makes later equality checks and dict probes pointer compares.
+_OPS = {s: sys.intern(s) for s in ('==', '!=', '<=', '>=', '<', '>', '+', '-', '*', '/', '!')}
+
+# Flat table indexed by TokenType.value: one list load per precedence
+# lookup instead of a dict hash on every token.
+PRECEDENCES = [Precedence.LOWEST] * _NUM_TOKEN_TYPES
+for _token_type, _precedence in (
+    (TokenType.PLUS, Precedence.SUM),
+    (TokenType.MINUS, Precedence.SUM),
+    (TokenType.ASTERISK, Precedence.PRODUCT),
+    (TokenType.DIV, Precedence.PRODUCT),
+    (TokenType.EQ, Precedence.EQUALS),
+    (TokenType.NEQ, Precedence.EQUALS),
+    (TokenType.LT, Precedence.LESSGREATER),
+    (TokenType.GT, Precedence.LESSGREATER),
+    (TokenType.LEQ, Precedence.LESSGREATER),
+    (TokenType.GEQ, Precedence.LESSGREATER),
+    (TokenType.LPAR, Precedence.CALL),
+    (TokenType.LBRACKET, Precedence.INDEX),
+):
+    PRECEDENCES[_token_type.value] = _precedence
+
+
+def _write(buf, node):
+    # Matches the old f-string behaviour of printing None for unset children.
+    if node is None:
+        buf.write('None')
+    else:
+        node.write_to(buf)
 
 
 class Node(ABC):
+    __slots__ = ('token',)
+
     def __init__(self, token: Token):
         self.token = token
 
-    @abstractmethod
     def __str__(self):
+        # Stringifying a tree renders into one shared buffer instead of
+        # building and concatenating a temporary string per child node.
+        buf = StringIO()
+        self.write_to(buf)
+        return buf.getvalue()
+
+    @abstractmethod
+    def write_to(self, buf):
         pass
 
 
 class Statement(Node, ABC):
+    __slots__ = ()
+
     def __init__(self, token):
         super().__init__(token)
 
 
 class Expression(Node, ABC):
+    __slots__ = ()
+
     def __init__(self, token):
         super().__init__(token)
 
 
 class Program(Node):
+    __slots__ = ('statements',)
+
     def __init__(self, token):
         super().__init__(token)
         self.statements: List[Statement] = []
 
-    def __str__(self):
-        return ' '.join([str(stmt) for stmt in self.statements])
+    def write_to(self, buf):
+        for i, stmt in enumerate(self.statements):
+            if i:
+                buf.write(' ')
+            stmt.write_to(buf)
 
 
 class ExpressionStatement(Statement):
+    __slots__ = ('expression',)
+
     def __init__(self, token):
         super().__init__(token)
         self.expression: Optional[Expression]
 
-    def __str__(self):
-        return f"{self.expression};"
+    def write_to(self, buf):
+        _write(buf, self.expression)
+        buf.write(';')
 
 
 class LetStatement(Statement):
+    __slots__ = ('name', 'value')
+
     def __init__(self, token):
         super().__init__(token)
         self.name: Identifier
         self.value: Optional[Expression]
 
-    def __str__(self):
-        return f"{self.token.literal} {self.name} = {self.value};"
+    def write_to(self, buf):
+        buf.write(self.token.literal)
+        buf.write(' ')
+        _write(buf, self.name)
+        buf.write(' = ')
+        _write(buf, self.value)
+        buf.write(';')
 
 
 class ReturnStatement(Statement):
+    __slots__ = ('return_value',)
+
     def __init__(self, token):
         super().__init__(token)
         self.return_value: Optional[Expression]
 
-    def __str__(self):
-        return f"{self.token.literal} {self.return_value};"
+    def write_to(self, buf):
+        buf.write(self.token.literal)
+        buf.write(' ')
+        _write(buf, self.return_value)
+        buf.write(';')
 
 
 class ForStatement(Statement):
+    __slots__ = ('counter', 'initial_value', 'condition', 'update_rule', 'body')
+
     def __init__(self, token):
         super().__init__(token)
         self.counter: Identifier
@@ -100,135 +160,310 @@ class ForStatement(Statement):
         self.update_rule: Optional[LetStatement]
         self.body: BlockStatement
 
-    def __str__(self):
-        return f"for({self.counter.value}, {self.condition}, {self.update_rule})"
+    def write_to(self, buf):
+        buf.write('for(')
+        buf.write(self.counter.value)
+        buf.write(', ')
+        _write(buf, self.condition)
+        buf.write(', ')
+        _write(buf, self.update_rule)
+        buf.write(')')
 
 
 class BlockStatement(Statement):
+    __slots__ = ('statements',)
+
     def __init__(self, token):
         super().__init__(token)
         self.statements: List[Statement] = []
 
-    def __str__(self):
-        return f"{' '.join([str(stmt) for stmt in self.statements])}"
+    def write_to(self, buf):
+        for i, stmt in enumerate(self.statements):
+            if i:
+                buf.write(' ')
+            stmt.write_to(buf)
 
 
 class Identifier(Expression):
+    __slots__ = ('value',)
+
     def __init__(self, token, value: str):
         super().__init__(token)
         self.value: str = value
 
-    def __str__(self):
-        return f"{self.value}"
+    def write_to(self, buf):
+        buf.write(self.value)
 
 
 class IntegerLiteral(Expression):
+    __slots__ = ('value',)
+
     def __init__(self, token, value: int):
         super().__init__(token)
         self.value: int = value
 
-    def __str__(self):
-        return f"{self.value}"
+    def write_to(self, buf):
+        buf.write(str(self.value))
+
+
+# Shared IntegerLiteral nodes for small values, in the spirit of CPython's
+# small-int cache: integer-heavy programs repeat the same handful of
+# constants, and literal nodes are never mutated once built.
+_INT_LITERAL_CACHE: dict = {}
+
+
+def make_integer_literal(token: Token, value: int) -> IntegerLiteral:
+    if -256 <= value < 256:
+        node = _INT_LITERAL_CACHE.get(value, None)
+        if node is None:
+            node = IntegerLiteral(Token(TokenType.DIGIT, str(value)), value)
+            _INT_LITERAL_CACHE[value] = node
+        return node
+    return IntegerLiteral(token, value)
 
 
 class Boolean(Expression):
+    __slots__ = ('value',)
+
     def __init__(self, token, value: bool):
         super().__init__(token)
         self.value: bool = value
 
-    def __str__(self):
-        return f"{self.value}"
+    def write_to(self, buf):
+        buf.write(str(self.value))
 
 
 class StringLiteral(Expression):
+    __slots__ = ('value',)
+
     def __init__(self, token, value: str):
         super().__init__(token)
         self.value: str = value
 
-    def __str__(self):
-        return f'"{self.value}"'
+    def write_to(self, buf):
+        buf.write('"')
+        buf.write(self.value)
+        buf.write('"')
 
 
 class ListLiteral(Expression):
+    __slots__ = ('elements',)
+
     def __init__(self, token, elements: list):
         super().__init__(token)
         self.elements: list = elements
 
-    def __str__(self):
-        elements = [str(e) for e in self.elements]
-        return f"[{', '.join(elements)}]"
+    def write_to(self, buf):
+        buf.write('[')
+        for i, element in enumerate(self.elements):
+            if i:
+                buf.write(', ')
+            element.write_to(buf)
+        buf.write(']')
 
 
 class FunctionLiteral(Expression):
+    __slots__ = ('parameters', 'body')
+
     def __init__(self, token):
         super().__init__(token)
         self.parameters: List[Identifier] | None = []
         self.body: BlockStatement
 
-    def __str__(self):
+    def write_to(self, buf):
+        buf.write('func(')
         if not self.parameters:
-            params = "ERROR"
+            buf.write('ERROR')
         else:
-            params = ', '.join([str(p) for p in self.parameters])
-        return f"func({params}) {self.body}"
+            for i, parameter in enumerate(self.parameters):
+                if i:
+                    buf.write(', ')
+                parameter.write_to(buf)
+        buf.write(') ')
+        _write(buf, self.body)
 
 
 class PrefixExpression(Expression):
+    __slots__ = ('operator', 'right')
+
     def __init__(self, token):
         super().__init__(token)
         self.operator: str
         self.right: Optional[Expression]
 
-    def __str__(self):
-        return f"({self.operator}{self.right})"
+    def write_to(self, buf):
+        buf.write('(')
+        buf.write(self.operator)
+        _write(buf, self.right)
+        buf.write(')')
 
 
 class InfixExpression(Expression):
+    __slots__ = ('left', 'operator', 'right')
+
     def __init__(self, token):
         super().__init__(token)
         self.left: Optional[Expression]
         self.operator: str
         self.right: Optional[Expression]
 
-    def __str__(self):
-        return f"({self.left} {self.operator} {self.right})"
+    def write_to(self, buf):
+        buf.write('(')
+        _write(buf, self.left)
+        buf.write(' ')
+        buf.write(self.operator)
+        buf.write(' ')
+        _write(buf, self.right)
+        buf.write(')')
 
 
 class IfExpression(Expression):
+    __slots__ = ('condition', 'consequence', 'alternative')
+
     def __init__(self, token):
         super().__init__(token)
         self.condition: Optional[Expression]
         self.consequence: BlockStatement
         self.alternative: Optional[BlockStatement] = None
 
-    def __str__(self):
+    def write_to(self, buf):
+        buf.write('if (')
+        _write(buf, self.condition)
+        buf.write(') {')
+        _write(buf, self.consequence)
+        buf.write('}')
         if self.alternative is not None:
-            return f"if ({self.condition}) {{{self.consequence}}} else {{{self.alternative}}}"
-        return f"if ({self.condition}) {{{self.consequence}}}"
+            buf.write(' else {')
+            self.alternative.write_to(buf)
+            buf.write('}')
 
 
 class CallExpression(Expression):
+    __slots__ = ('function', 'arguments')
+
     def __init__(self, token):
         super().__init__(token)
         self.function: Optional[Expression]
         self.arguments: List[Expression] | None = []
 
-    def __str__(self):
+    def write_to(self, buf):
+        _write(buf, self.function)
+        buf.write('(')
         if not self.arguments:
-            args = "ERROR"
+            buf.write('ERROR')
         else:
-            args = ', '.join([str(a) for a in self.arguments])
-        return f"{self.function}({args})"
+            for i, argument in enumerate(self.arguments):
+                if i:
+                    buf.write(', ')
+                argument.write_to(buf)
+        buf.write(')')
 
 
 class IndexExpression(Expression):
+    __slots__ = ('collection', 'idx')
+
     def __init__(self, token):
         super().__init__(token)
         self.collection: Optional[ListLiteral]
         self.idx: Optional[Expression]
 
-    def __str__(self):
-        return f"{self.collection}[{self.idx}]"
+    def write_to(self, buf):
+        _write(buf, self.collection)
+        buf.write('[')
+        _write(buf, self.idx)
+        buf.write(']')
+
+
+_FOLDABLE_INFIX_OPS = {
+    '+': lambda a, b: a + b,
+    '-': lambda a, b: a - b,
+    '*': lambda a, b: a * b,
+    '/': lambda a, b: int(a / b),
+    '<': lambda a, b: a < b,
+    '>': lambda a, b: a > b,
+    '<=': lambda a, b: a <= b,
+    '>=': lambda a, b: a >= b,
+    '==': lambda a, b: a == b,
+    '!=': lambda a, b: a != b,
+}
+
+
+def fold(node):
+    """Collapse constant subtrees into single literal nodes.
+
+    Walks the AST once, replacing infix expressions over two integer
+    literals and prefix expressions over a literal with the precomputed
+    literal, so the evaluator never re-walks statically known subtrees.
+    """
+    if node is None:
+        return None
+    if isinstance(node, (Program, BlockStatement)):
+        node.statements = [fold(stmt) for stmt in node.statements]
+        return node
+    if isinstance(node, ExpressionStatement):
+        node.expression = fold(node.expression)
+        return node
+    if isinstance(node, LetStatement):
+        node.value = fold(node.value)
+        return node
+    if isinstance(node, ReturnStatement):
+        node.return_value = fold(node.return_value)
+        return node
+    if isinstance(node, ForStatement):
+        node.initial_value = fold(node.initial_value)
+        node.condition = fold(node.condition)
+        node.update_rule = fold(node.update_rule)
+        node.body = fold(node.body)
+        return node
+    if isinstance(node, FunctionLiteral):
+        node.body = fold(node.body)
+        return node
+    if isinstance(node, IfExpression):
+        node.condition = fold(node.condition)
+        node.consequence = fold(node.consequence)
+        node.alternative = fold(node.alternative)
+        return node
+    if isinstance(node, CallExpression):
+        if node.arguments:
+            node.arguments = [fold(a) for a in node.arguments]
+        return node
+    if isinstance(node, IndexExpression):
+        node.idx = fold(node.idx)
+        return node
+    if isinstance(node, ListLiteral):
+        node.elements = [fold(e) for e in node.elements]
+        return node
+    if isinstance(node, PrefixExpression):
+        node.right = fold(node.right)
+        return _fold_prefix(node)
+    if isinstance(node, InfixExpression):
+        node.left = fold(node.left)
+        node.right = fold(node.right)
+        return _fold_infix(node)
+    return node
+
+
+def _fold_prefix(node):
+    if node.operator == '-' and isinstance(node.right, IntegerLiteral):
+        return make_integer_literal(node.token, -node.right.value)
+    if node.operator == '!' and isinstance(node.right, Boolean):
+        return Boolean(node.token, not node.right.value)
+    return node
+
+
+def _fold_infix(node):
+    if not (isinstance(node.left, IntegerLiteral) and isinstance(node.right, IntegerLiteral)):
+        return node
+    op = _FOLDABLE_INFIX_OPS.get(node.operator, None)
+    if op is None:
+        return node
+    if node.operator == '/' and node.right.value == 0:
+        # Leave division by zero for the evaluator to report at runtime.
+        return node
+    value = op(node.left.value, node.right.value)
+    if isinstance(value, bool):
+        return Boolean(node.token, value)
+    return make_integer_literal(node.token, value)
 
 
 def trace(func):
@@ -246,39 +481,52 @@ def trace(func):
 class Parser:
     def __init__(self, lexer: Lexer, trace_parsing=False):
         self.lexer: Lexer = lexer
-        self.cur_token: Token = self.lexer.next_token()
-        self.next_token: Token = self.lexer.next_token()
+        # Materialize the token stream up front: the grammar is parsed
+        # predictively (each position is visited exactly once, so a packrat
+        # memo table would never hit), and a flat list gives O(1) lookahead
+        # without calling back into the lexer per token.
+        self.tokens: List[Token] = self.lexer.tokenize()
+        self.pos: int = 0
+        last = len(self.tokens) - 1
+        self.cur_token: Token = self.tokens[0]
+        self.next_token: Token = self.tokens[min(1, last)]
 
         self.errors: List[str] = []
         self.program: Program
         
-        self.prefix_functions = {
-            TokenType.ID: self.parse_identifier,
-            TokenType.DIGIT: self.parse_integer_literal,
-            TokenType.FUNC: self.parse_function_literal,
-            TokenType.TRUE: self.parse_boolean,
-            TokenType.FALSE: self.parse_boolean,
-            TokenType.NOT: self.parse_prefix_expression,
-            TokenType.MINUS: self.parse_prefix_expression,
-            TokenType.LPAR: self.parse_grouped_expression,
-            TokenType.IF: self.parse_if_expression,
-            TokenType.STRING: self.parse_string,
-            TokenType.LBRACKET: self.parse_list_literal,
-        }
-        self.infix_functions = {
-            TokenType.PLUS: self.parse_infix_expression,
-            TokenType.MINUS: self.parse_infix_expression,
-            TokenType.ASTERISK: self.parse_infix_expression,
-            TokenType.DIV: self.parse_infix_expression,
-            TokenType.LT: self.parse_infix_expression,
-            TokenType.GT: self.parse_infix_expression,
-            TokenType.EQ: self.parse_infix_expression,
-            TokenType.NEQ: self.parse_infix_expression,
-            TokenType.LEQ: self.parse_infix_expression,
-            TokenType.GEQ: self.parse_infix_expression,
-            TokenType.LPAR: self.parse_call_expression,
-            TokenType.LBRACKET: self.parse_index_expression,
-        }
+        # Dispatch tables indexed by TokenType.value, so the Pratt loop
+        # does a list load per token instead of a dict lookup.
+        self.prefix_functions = [None] * _NUM_TOKEN_TYPES
+        for token_type, prefix_fn in (
+            (TokenType.ID, self.parse_identifier),
+            (TokenType.DIGIT, self.parse_integer_literal),
+            (TokenType.FUNC, self.parse_function_literal),
+            (TokenType.TRUE, self.parse_boolean),
+            (TokenType.FALSE, self.parse_boolean),
+            (TokenType.NOT, self.parse_prefix_expression),
+            (TokenType.MINUS, self.parse_prefix_expression),
+            (TokenType.LPAR, self.parse_grouped_expression),
+            (TokenType.IF, self.parse_if_expression),
+            (TokenType.STRING, self.parse_string),
+            (TokenType.LBRACKET, self.parse_list_literal),
+        ):
+            self.prefix_functions[token_type.value] = prefix_fn
+        self.infix_functions = [None] * _NUM_TOKEN_TYPES
+        for token_type, infix_fn in (
+            (TokenType.PLUS, self.parse_infix_expression),
+            (TokenType.MINUS, self.parse_infix_expression),
+            (TokenType.ASTERISK, self.parse_infix_expression),
+            (TokenType.DIV, self.parse_infix_expression),
+            (TokenType.LT, self.parse_infix_expression),
+            (TokenType.GT, self.parse_infix_expression),
+            (TokenType.EQ, self.parse_infix_expression),
+            (TokenType.NEQ, self.parse_infix_expression),
+            (TokenType.LEQ, self.parse_infix_expression),
+            (TokenType.GEQ, self.parse_infix_expression),
+            (TokenType.LPAR, self.parse_call_expression),
+            (TokenType.LBRACKET, self.parse_index_expression),
+        ):
+            self.infix_functions[token_type.value] = infix_fn
         self.trace_parsing: bool = trace_parsing
         self.indent = 0
 
@@ -294,18 +542,18 @@ class Parser:
 
     @trace
     def parse_statement(self):
-        match self.cur_token.token_type:
-            case TokenType.LET:
-                stmt = self.parse_let_statement()
-            case TokenType.RETURN:
-                stmt = self.parse_return_statement()
-            case TokenType.FOR:
-                stmt = self.parse_for_statement()
-            case TokenType.COMMENT:
-                return None
-            case _:
-                stmt = self.parse_expression_statement()
-        return stmt
+        # Enum members are singletons, so identity checks skip the
+        # __eq__ call the match statement would make per case.
+        token_type = self.cur_token.token_type
+        if token_type is TokenType.LET:
+            return self.parse_let_statement()
+        if token_type is TokenType.RETURN:
+            return self.parse_return_statement()
+        if token_type is TokenType.FOR:
+            return self.parse_for_statement()
+        if token_type is TokenType.COMMENT:
+            return None
+        return self.parse_expression_statement()
 
     @trace
     def parse_let_statement(self) -> Optional[LetStatement]:
@@ -388,14 +636,14 @@ class Parser:
 
     @trace
     def parse_expression(self, precedence: Precedence) -> Expression | None:
-        prefix = self.prefix_functions.get(self.cur_token.token_type, None)
+        prefix = self.prefix_functions[self.cur_token.token_type.value]
         if prefix is None:
             self.errors.append(f"No prefix parser function for {self.cur_token}")
             return None
         left_exp = prefix()
 
         while not self._peek_token_is(TokenType.SEMICOLON) and precedence < self._peek_precedence():
-            infix = self.infix_functions.get(self.next_token.token_type, None)
+            infix = self.infix_functions[self.next_token.token_type.value]
             if infix is None:
                 return left_exp
             self.advance_tokens()
@@ -405,7 +653,7 @@ class Parser:
     @trace
     def parse_prefix_expression(self):
         expr = PrefixExpression(self.cur_token)
-        expr.operator = self.cur_token.literal
+        expr.operator = _OPS.get(self.cur_token.literal, self.cur_token.literal)
         self.advance_tokens()
         expr.right = self.parse_expression(Precedence.PREFIX)
         return expr
@@ -414,7 +662,7 @@ class Parser:
     def parse_infix_expression(self, left_expr: Expression):
         expr = InfixExpression(self.cur_token)
         expr.left = left_expr
-        expr.operator = self.cur_token.literal
+        expr.operator = _OPS.get(self.cur_token.literal, self.cur_token.literal)
         precedence = self._cur_precedence()
         self.advance_tokens()
         expr.right = self.parse_expression(precedence)
@@ -485,7 +733,7 @@ class Parser:
 
     @trace
     def parse_integer_literal(self):
-        return IntegerLiteral(self.cur_token, int(self.cur_token.literal))
+        return make_integer_literal(self.cur_token, int(self.cur_token.literal))
 
     @trace
     def parse_boolean(self):
@@ -536,26 +784,22 @@ class Parser:
         return params
 
     def advance_tokens(self) -> None:
-        self.cur_token = self.next_token
-        self.next_token = self.lexer.next_token()
+        self.pos += 1
+        last = len(self.tokens) - 1
+        self.cur_token = self.tokens[min(self.pos, last)]
+        self.next_token = self.tokens[min(self.pos + 1, last)]
 
     def _cur_token_is(self, tt: TokenType):
-        return self.cur_token.token_type == tt
+        return self.cur_token.token_type is tt
 
     def _cur_precedence(self):
-        precedence = PRECEDENCES.get(self.cur_token.token_type, None)
-        if precedence is not None:
-            return precedence
-        return Precedence.LOWEST
+        return PRECEDENCES[self.cur_token.token_type.value]
 
     def _peek_token_is(self, tt: TokenType):
-        return self.next_token.token_type == tt
+        return self.next_token.token_type is tt
 
     def _peek_precedence(self):
-        precedence = PRECEDENCES.get(self.next_token.token_type, None)
-        if precedence is not None:
-            return precedence
-        return Precedence.LOWEST
+        return PRECEDENCES[self.next_token.token_type.value]
 
     def _peek_error(self, tt):
         self.errors.append(f"Expected next token to be {tt}, got {self.next_token.token_type}.")
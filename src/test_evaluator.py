@@ -1,12 +1,29 @@
+import copy
+
 import pytest
 from .test_parser import get_program
-from .evaluator import eval, ObjectType, Environment
+from .evaluator import (
+    eval,
+    ObjectType,
+    Environment,
+    compile_to_python,
+    run_compiled,
+    flatten_to_rpn,
+    run_rpn,
+)
+
+
+# One environment shared by every test; reset() between runs clears the
+# bindings without reallocating it.
+_ENV = Environment()
 
 
 def get_eval(input):
-    env = Environment()
-    program = get_program(input)
-    return eval(program, env) 
+    _ENV.reset()
+    # get_program caches ASTs by source string; evaluate a copy so a test
+    # never observes mutations made while evaluating an earlier one.
+    program = copy.deepcopy(get_program(input))
+    return eval(program, _ENV)
 
 
 def check_integer_object(evaluated, expected_value):
@@ -25,7 +42,6 @@ def check_string_object(evaluated, expected_value):
 
 
 def check_null_object(evaluated):
-    print(evaluated, dir(evaluated), evaluated.otype)
     assert evaluated.otype == ObjectType.NULL, str(evaluated)
 
 
@@ -45,6 +61,51 @@ def test_eval_integer_expression(input, value):
     check_integer_object(evaluated, value)
 
 
+@pytest.mark.parametrize(
+    'input,value', [
+        ('10', 10),
+        ('5 + 5 + 5 + 5 * 2', 25),
+        ('-5 + 5 / 5 + 5 * 2', 6),
+        ('-5 + 5 / (5 + 5) * 2', -5),
+        ('3 == 5 - 2', True),
+        ('!!true', True),
+    ]
+)
+def test_compiled_constant_expressions(input, value):
+    code = compile_to_python(get_program(input))
+    assert code is not None
+    evaluated = run_compiled(code)
+    if isinstance(value, bool):
+        check_boolean_object(evaluated, value)
+    else:
+        check_integer_object(evaluated, value)
+
+
+def test_compile_to_python_rejects_non_constant_programs():
+    assert compile_to_python(get_program('let a = 5; a;')) is None
+    assert compile_to_python(get_program('some_var;')) is None
+
+
+@pytest.mark.parametrize(
+    'input,value', [
+        ('10', 10),
+        ('-5', -5),
+        ('5 + 5 + 5 + 5 * 2', 25),
+        ('-5 + 5 / 5 + 5 * 2', 6),
+        ('-5 + 5 / (5 + 5) * 2', -5),
+    ]
+)
+def test_rpn_integer_expressions(input, value):
+    flattened = flatten_to_rpn(get_program(input))
+    assert flattened is not None
+    check_integer_object(run_rpn(*flattened), value)
+
+
+def test_flatten_to_rpn_rejects_non_integer_programs():
+    assert flatten_to_rpn(get_program('3 == 5 - 2')) is None
+    assert flatten_to_rpn(get_program('let a = 5; a;')) is None
+
+
 @pytest.mark.parametrize(
     'input,value', [
         ('true', True),
@@ -3,69 +3,48 @@ from pytest import mark
 from .lexer import TokenType, Lexer
 
 
-@mark.parametrize(
-    'ch,tt', [
-        ('(', TokenType.LPAR),
-        (')', TokenType.RPAR),
-        ('[', TokenType.LBRACKET),
-        (']', TokenType.RBRACKET),
-        (';', TokenType.SEMICOLON),
-        (',', TokenType.COMMA),
-        ('-', TokenType.MINUS),
-        ('+', TokenType.PLUS),
-        ('*', TokenType.ASTERISK),
-        ('/', TokenType.DIV),
-        ('=', TokenType.EQUALS),
-    ]
-)
-def test_valid_symbols(ch, tt):
-    lex = Lexer(ch)
-    token = lex.next_token()
-    assert token is not None
-    assert token.token_type == tt
-    assert token.literal == ch
-    assert lex.next_token().token_type is TokenType.EOF
-
-
-@mark.parametrize(
-    'ch,tt', [
-        ('808723', TokenType.DIGIT),
-        ('01', TokenType.DIGIT),
-        ('2', TokenType.DIGIT),
-        ('name', TokenType.ID),
-        ('_name', TokenType.ID),
-        ('na_me', TokenType.ID),
-        ('name_', TokenType.ID),
-        ('name_23', TokenType.ID),
-        ('name_2', TokenType.ID),
-    ]
+# One row per input that lexes to a single token whose literal is the
+# input itself: symbols, digits, identifiers and keywords. Kept as one
+# table-driven test so pytest pays setup/reporting cost once, not per row.
+SINGLE_TOKEN_CASES = (
+    ('(', TokenType.LPAR),
+    (')', TokenType.RPAR),
+    ('[', TokenType.LBRACKET),
+    (']', TokenType.RBRACKET),
+    (';', TokenType.SEMICOLON),
+    (',', TokenType.COMMA),
+    ('-', TokenType.MINUS),
+    ('+', TokenType.PLUS),
+    ('*', TokenType.ASTERISK),
+    ('/', TokenType.DIV),
+    ('=', TokenType.EQUALS),
+    ('808723', TokenType.DIGIT),
+    ('01', TokenType.DIGIT),
+    ('2', TokenType.DIGIT),
+    ('name', TokenType.ID),
+    ('_name', TokenType.ID),
+    ('na_me', TokenType.ID),
+    ('name_', TokenType.ID),
+    ('name_23', TokenType.ID),
+    ('name_2', TokenType.ID),
+    ('for', TokenType.FOR),
+    ('if', TokenType.IF),
+    ('let', TokenType.LET),
+    ('else', TokenType.ELSE),
+    ('func', TokenType.FUNC),
+    ('return', TokenType.RETURN),
 )
-def test_valid_digits_and_identifiers(ch, tt):
-    lex = Lexer(ch)
-    token = lex.next_token()
-    assert token is not None
-    assert token.token_type == tt
-    assert token.literal == ch
-    assert lex.next_token().token_type is TokenType.EOF
 
 
-@mark.parametrize(
-    'ch,tt', [
-        ('for', TokenType.FOR),
-        ('if', TokenType.IF),
-        ('let', TokenType.LET),
-        ('else', TokenType.ELSE),
-        ('func', TokenType.FUNC),
-        ('return', TokenType.RETURN),
-    ]
-)
-def test_valid_keyword_identifiers(ch, tt):
-    lex = Lexer(ch)
-    token = lex.next_token()
-    assert token is not None
-    assert token.token_type == tt
-    assert token.literal == ch
-    assert lex.next_token().token_type is TokenType.EOF
+def test_single_token_inputs():
+    actual = []
+    for ch, _ in SINGLE_TOKEN_CASES:
+        lex = Lexer(ch)
+        token = lex.next_token()
+        actual.append((ch, token.token_type, token.literal))
+        assert lex.next_token().token_type is TokenType.EOF
+    expected = [(ch, tt, ch) for ch, tt in SINGLE_TOKEN_CASES]
+    assert actual == expected
 
 
 @mark.parametrize(
@@ -98,14 +77,11 @@ def test_valid_keyword_identifiers(ch, tt):
     ]
 )
 def test_valid_streams(cs, ts):
-    lex = Lexer(cs)
-    token = lex.next_token()
-    cur_ts = 0
-    while token.token_type != TokenType.EOF:
-        assert token.token_type == ts[cur_ts][0]
-        assert token.literal == ts[cur_ts][1]
-        cur_ts += 1
-        token = lex.next_token()
+    token_types, literals = Lexer(cs).tokenize_soa()
+    assert token_types[-1] == TokenType.EOF.value
+    assert len(token_types) == len(ts) + 1
+    assert list(token_types[:-1]) == [tt.value for tt, _ in ts]
+    assert literals[:-1] == [literal for _, literal in ts]
 
 
 @mark.parametrize(
@@ -150,14 +126,11 @@ def test_valid_streams(cs, ts):
     ]
 )
 def test_equality_operations(cs, ts):
-    lex = Lexer(cs)
-    token = lex.next_token()
-    cur_ts = 0
-    while token.token_type != TokenType.EOF:
-        assert token.token_type == ts[cur_ts][0]
-        assert token.literal == ts[cur_ts][1]
-        cur_ts += 1
-        token = lex.next_token()
+    tokens = list(Lexer(cs))
+    assert len(tokens) == len(ts)
+    for token, (tt, literal) in zip(tokens, ts):
+        assert token.token_type == tt
+        assert token.literal == literal
 
 
 @mark.parametrize(
@@ -171,14 +144,11 @@ def test_equality_operations(cs, ts):
     ]
 )
 def test_logical_operations(cs, ts):
-    lex = Lexer(cs)
-    token = lex.next_token()
-    cur_ts = 0
-    while token.token_type != TokenType.EOF:
-        assert token.token_type == ts[cur_ts][0]
-        assert token.literal == ts[cur_ts][1]
-        cur_ts += 1
-        token = lex.next_token()
+    tokens = list(Lexer(cs))
+    assert len(tokens) == len(ts)
+    for token, (tt, literal) in zip(tokens, ts):
+        assert token.token_type == tt
+        assert token.literal == literal
 
 
 def test_trailing_whitespace():
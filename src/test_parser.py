@@ -1,3 +1,5 @@
+import functools
+
 import pytest
 
 from .lexer import Lexer, TokenType
@@ -23,11 +25,14 @@ from .parser import (
 
 
 def check_parser_errors(parser):
-    if len(parser.errors) != 0:
+    if parser.errors:
         raise ValueError('\n'.join(parser.errors))
 
 
+@functools.lru_cache(maxsize=256)
 def get_program(input_string):
+    # Many parametrized cases (here and in test_evaluator) parse the same
+    # source string; cache the AST per string instead of re-parsing.
     parser = Parser(Lexer(input_string))
     program = parser.parse_program()
     check_parser_errors(parser)
@@ -49,24 +54,27 @@ def check_identifier(node: Identifier, value: str):
     assert node.value == value
 
 
-def check_boolean(node: Boolean, value: str):
-    assert node.token.literal == str(value).lower()
+_BOOL_LIT = {True: 'true', False: 'false'}
+
+
+def check_boolean(node: Boolean, value: bool):
+    assert node.token.literal == _BOOL_LIT[value]
     assert node.value == value
 
 
 def check_literal_expression(expr, expected_value):
-    if type(expr) == IntegerLiteral:
+    if expr.__class__ is IntegerLiteral:
         check_integer_literal(expr, expected_value)
-    elif type(expr) == Identifier:
+    elif expr.__class__ is Identifier:
         check_identifier(expr, expected_value)
-    elif type(expr) == Boolean:
+    elif expr.__class__ is Boolean:
         check_boolean(expr, expected_value)
     else:
         raise ValueError(f"Unexpected expression type: {type(expr)}")
     
 
 def check_infix_expression(expr, left, op, right):
-    assert type(expr) == InfixExpression
+    assert expr.__class__ is InfixExpression
     check_literal_expression(expr.left, left)
     check_literal_expression(expr.right, right)
     assert expr.operator == op
@@ -109,7 +117,7 @@ def test_return_statement(input, integer_value):
     assert len(program.statements) == 1
 
     for stmt in program.statements:
-        assert type(stmt) == ReturnStatement
+        assert stmt.__class__ is ReturnStatement
         check_integer_literal(stmt.return_value, integer_value)
 
 
@@ -124,7 +132,7 @@ def test_for_statement():
     assert program is not None
     assert len(program.statements) == 3
     for_stmt = program.statements[1]
-    assert type(for_stmt) == ForStatement
+    assert for_stmt.__class__ is ForStatement
     assert for_stmt.counter.value == 'i'
     check_integer_literal(for_stmt.initial_value, 1)
     assert str(for_stmt.condition) == '(i <= 5)'
@@ -137,9 +145,9 @@ def test_identifier_expression():
     assert program is not None
     assert len(program.statements) == 1
     expr_stmt = program.statements[0]
-    assert type(expr_stmt) == ExpressionStatement
+    assert expr_stmt.__class__ is ExpressionStatement
     identifier = expr_stmt.expression
-    assert type(identifier) == Identifier
+    assert identifier.__class__ is Identifier
     assert identifier.value == 'some_var'
 
 
@@ -149,7 +157,7 @@ def test_integer_literal_expression():
     assert program is not None
     assert len(program.statements) == 1
     expr_stmt = program.statements[0]
-    assert type(expr_stmt) == ExpressionStatement
+    assert expr_stmt.__class__ is ExpressionStatement
     integer_literal = expr_stmt.expression
     check_integer_literal(integer_literal, 534)
 
@@ -160,7 +168,7 @@ def test_string_literal_expression():
     assert program is not None
     assert len(program.statements) == 1
     expr_stmt = program.statements[0]
-    assert type(expr_stmt) == ExpressionStatement
+    assert expr_stmt.__class__ is ExpressionStatement
     string_literal = expr_stmt.expression
     check_string_literal(string_literal, 'hello')
 
@@ -188,9 +196,9 @@ def test_prefix_operators(input, operator, integer_value):
     assert program is not None
     assert len(program.statements) == 1
     expr_stmt = program.statements[0]
-    assert type(expr_stmt) == ExpressionStatement
+    assert expr_stmt.__class__ is ExpressionStatement
     prefix_expr = expr_stmt.expression
-    assert type(prefix_expr) == PrefixExpression
+    assert prefix_expr.__class__ is PrefixExpression
     assert prefix_expr.operator == operator
     check_integer_literal(prefix_expr.right, integer_value)
 
@@ -216,9 +224,9 @@ def test_single_infix_operators(input, operator, lvalue, rvalue):
     assert program is not None
     assert len(program.statements) == 1
     expr_stmt = program.statements[0]
-    assert type(expr_stmt) == ExpressionStatement
+    assert expr_stmt.__class__ is ExpressionStatement
     expr = expr_stmt.expression
-    assert type(expr) == InfixExpression
+    assert expr.__class__ is InfixExpression
     assert expr.operator == operator
     check_integer_literal(expr.left, lvalue)
     check_integer_literal(expr.right, rvalue)
@@ -262,19 +270,19 @@ def test_if_expression():
     stmts = program.statements
     assert len(stmts) == 1
     expr_stmt = stmts[0]
-    assert type(expr_stmt) == ExpressionStatement
+    assert expr_stmt.__class__ is ExpressionStatement
     if_expr = expr_stmt.expression
-    assert type(if_expr) == IfExpression
+    assert if_expr.__class__ is IfExpression
     condition = if_expr.condition
     consequence = if_expr.consequence
-    assert type(condition) == InfixExpression
-    assert type(consequence) == BlockStatement
+    assert condition.__class__ is InfixExpression
+    assert consequence.__class__ is BlockStatement
     check_infix_expression(condition, 'x', '<', 'y')
 
     stmts = consequence.statements
     assert len(stmts) == 1
     expr_stmt = stmts[0]
-    assert type(expr_stmt) == ExpressionStatement
+    assert expr_stmt.__class__ is ExpressionStatement
     assert expr_stmt.expression.value == 'x'
 
 
@@ -283,27 +291,27 @@ def test_if_else_expression():
     stmts = program.statements
     assert len(stmts) == 1
     expr_stmt = stmts[0]
-    assert type(expr_stmt) == ExpressionStatement
+    assert expr_stmt.__class__ is ExpressionStatement
     if_else_expr = expr_stmt.expression
-    assert type(if_else_expr) == IfExpression
+    assert if_else_expr.__class__ is IfExpression
     condition = if_else_expr.condition
     consequence = if_else_expr.consequence
     alternative = if_else_expr.alternative
-    assert type(condition) == InfixExpression
-    assert type(consequence) == BlockStatement
-    assert type(alternative) == BlockStatement
+    assert condition.__class__ is InfixExpression
+    assert consequence.__class__ is BlockStatement
+    assert alternative.__class__ is BlockStatement
     check_infix_expression(condition, 'x', '<', 'y')
 
     stmts = consequence.statements
     assert len(stmts) == 1
     expr_stmt = stmts[0]
-    assert type(expr_stmt) == ExpressionStatement
+    assert expr_stmt.__class__ is ExpressionStatement
     assert expr_stmt.expression.value == 'x'
 
     stmts = alternative.statements
     assert len(stmts) == 1
     expr_stmt = stmts[0]
-    assert type(expr_stmt) == ExpressionStatement
+    assert expr_stmt.__class__ is ExpressionStatement
     assert expr_stmt.expression.value == 'y'
 
 
@@ -322,18 +330,18 @@ def test_function_literal():
     stmts = program.statements
     assert len(stmts) == 1
     expr_stmt = stmts[0]
-    assert type(expr_stmt) == ExpressionStatement
+    assert expr_stmt.__class__ is ExpressionStatement
     func_literal = expr_stmt.expression
-    assert type(func_literal) == FunctionLiteral
+    assert func_literal.__class__ is FunctionLiteral
     parameters = func_literal.parameters
     body = func_literal.body
-    assert type(body) == BlockStatement
+    assert body.__class__ is BlockStatement
 
     assert parameters[0].value == 'x'
     assert parameters[1].value == 'y'
 
     body_stmt = body.statements[0]
-    assert type(body_stmt) == ReturnStatement
+    assert body_stmt.__class__ is ReturnStatement
 
 
 def test_function_call_expression():
@@ -341,17 +349,17 @@ def test_function_call_expression():
     stmts = program.statements
     assert len(stmts) == 1
     expr_stmt = stmts[0]
-    assert type(expr_stmt) == ExpressionStatement
+    assert expr_stmt.__class__ is ExpressionStatement
     call_expr = expr_stmt.expression
-    assert type(call_expr) == CallExpression
+    assert call_expr.__class__ is CallExpression
     function = call_expr.function
     arguments = call_expr.arguments
 
-    assert type(function) == FunctionLiteral
+    assert function.__class__ is FunctionLiteral
     arg0 = arguments[0]
     arg1 = arguments[1]
-    assert type(arg0) == IntegerLiteral
-    assert type(arg1) == IntegerLiteral
+    assert arg0.__class__ is IntegerLiteral
+    assert arg1.__class__ is IntegerLiteral
     assert arg0.value == 1
     assert arg1.value == 2
 
@@ -366,9 +374,9 @@ def test_list_literal():
     stmts = program.statements
     assert len(stmts) == 1
     let_stmt = stmts[0]
-    assert type(let_stmt) == LetStatement
+    assert let_stmt.__class__ is LetStatement
     list_literal = let_stmt.value
-    assert type(list_literal) == ListLiteral
+    assert list_literal.__class__ is ListLiteral
     for value, exp_val in zip(list_literal.elements, [1, 2, 3]):
         check_integer_literal(value, exp_val)
 
@@ -376,7 +384,7 @@ def test_list_literal():
 def test_index_expression():
     program = get_program("a[2];")
     index_expr = program.statements[0].expression
-    assert type(index_expr) == IndexExpression
+    assert index_expr.__class__ is IndexExpression
     check_identifier(index_expr.collection, "a")
     check_integer_literal(index_expr.idx, 2)
 
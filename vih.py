@@ -1,13 +1,23 @@
+import hashlib
+import os
+import pickle
 import sys
+import time
 
 from src.lexer import Lexer, TokenType
-from src.parser import Parser
+from src.parser import Parser, PARSER_VERSION
 from src.evaluator import eval, Environment
 
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'vih')
+
+use_cache = True
+if '--no-cache' in sys.argv:
+    sys.argv.remove('--no-cache')
+    use_cache = False
 
 option = None
 if len(sys.argv) < 2 or len(sys.argv) > 3:
-    print("Usage: python3 vih.py <input_file> [lexer|parser|eval]")
+    print("Usage: python3 vih.py [--no-cache] <input_file> [lexer|parser|eval]")
     exit()
 elif len(sys.argv) == 3:
     file, option = sys.argv[1], sys.argv[2]
@@ -19,14 +29,10 @@ trace_parsing = False
 match option:
     case 'lexer':
         with open(file, 'r') as f:
-            lines = f.readlines()
-        for line in lines:
-            lex = Lexer(line)
-            token = lex.next_token()
-            while token.token_type != TokenType.EOF:
-                print(token, end=' ')
-                token = lex.next_token()
-            print()
+            lex = Lexer(f.read())
+        for token in lex:
+            print(token, end=' ')
+        print()
         exit()
     case 'parser':
         trace_parsing = True
@@ -42,14 +48,53 @@ match option:
 with open(file, 'r') as f:
     input_string = f.read()
 
+# Reuse the parsed AST from a previous run of the same source. The key
+# includes the interpreter and parser versions so stale pickles are
+# ignored; tracing the parser requires a real parse, so it skips the cache.
+program = None
+cache_path = None
+if use_cache and not trace_parsing:
+    key_material = '%s:%s:%s' % (sys.version_info[:2], PARSER_VERSION, input_string)
+    key = hashlib.sha256(key_material.encode()).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, key + '.pkl')
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            program = pickle.load(cache_file)
+    except (OSError, EOFError, pickle.PickleError):
+        # A missing, truncated or otherwise corrupt entry just means a
+        # fresh parse; pickle.load raises EOFError on truncated files.
+        program = None
+
+parser_errors = []
+if program is None:
+    # The Parser tokenizes the whole input in its constructor, so timing
+    # construction and parse_program separately splits the lex and parse
+    # phases; the summary keeps future optimizations aimed at the right one.
+    t0 = time.perf_counter()
+    parser = Parser(Lexer(input_string), trace_parsing=trace_parsing)
+    t1 = time.perf_counter()
+    program = parser.parse_program()
+    t2 = time.perf_counter()
+    parser_errors = parser.errors
+    if trace_parsing:
+        print('lex=%.4fs parse=%.4fs tokens=%d' % (t1 - t0, t2 - t1, len(parser.tokens)))
+    if cache_path is not None and not parser_errors:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # Dump to a temp file and rename into place so an interrupted
+            # run can never leave a partial pickle at the final path.
+            tmp_path = cache_path + '.%d.tmp' % os.getpid()
+            with open(tmp_path, 'wb') as cache_file:
+                pickle.dump(program, cache_file)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
 env = Environment(trace_eval=trace_eval)
-lex = Lexer(input_string)
-parser = Parser(lex, trace_parsing=trace_parsing)
-program = parser.parse_program()
 result = eval(program, env)
 
-if parser.errors:
-    print('\n'.join(parser.errors))
+if parser_errors:
+    print('\n'.join(parser_errors))
     exit()
 if result is not None:
     print(result)